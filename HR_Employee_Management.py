@@ -10,25 +10,84 @@ Features:
 """
 
 import csv
+import functools
 import os
 from datetime import date
 
+# Full-time bonus rules
+_FT_BASE_BONUS = 0.05      # base annual bonus percent
+_FT_EXTRA_PER_STEP = 0.01  # extra bonus per completed step of service
+_FT_YEARS_STEP = 3         # years of service per step
+_FT_MAX_EXTRA = 0.05       # cap on the extra bonus
+
+
+def _as_date(value):
+    """Return a join_date value as a date, parsing YYYY-MM-DD strings."""
+    if isinstance(value, str):
+        y, m, d = value.split('-')
+        return date(int(y), int(m), int(d))
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _years_between(join_ordinal, today_ordinal):
+    """Whole years elapsed between two date ordinals (shared across employees)."""
+    jd = date.fromordinal(join_ordinal)
+    today = date.fromordinal(today_ordinal)
+    return today.year - jd.year - ((today.month, today.day) < (jd.month, jd.day))
+
+
+def _ft_pay(monthly_salary, months, years, bonus_percent, apply_bonus):
+    """Full-time pay for one employee; the single source of the full-time pay arithmetic."""
+    base = monthly_salary * months
+    if apply_bonus:
+        extra = min((years // _FT_YEARS_STEP) * _FT_EXTRA_PER_STEP, _FT_MAX_EXTRA)
+        return round(base + base * (bonus_percent + extra), 2)
+    return round(base, 2)
+
+
+@functools.lru_cache(maxsize=32, typed=True)
+def _ft_kernel(months, apply_bonus):
+    """Return _ft_pay() specialised for one (months, apply_bonus) payroll run.
+
+    Used by HRSystem.payroll_bulk(), which looks the kernel up once per run.
+    """
+    if apply_bonus:
+        def kernel(monthly_salary, years, bonus_percent):
+            return _ft_pay(monthly_salary, months, years, bonus_percent, True)
+    else:
+        def kernel(monthly_salary, years, bonus_percent):
+            return _ft_pay(monthly_salary, months, 0, bonus_percent, False)
+    return kernel
+
 
 class Employee:
     """Base class for all employees.
 
     - Stores employee attributes in a dictionary `self.data` for easy serialization.
     - Provides an interface method calculate_salary() to be overridden by subclasses.
+    - Uses __slots__ so instances carry no per-object __dict__ besides `self.data`.
     """
 
+    __slots__ = ('data', '_yos_cache')
+
     def __init__(self, emp_id, name, join_date, role='Employee'):
+        # Parse YYYY-MM-DD strings once; anything unparseable (e.g. a blank CSV cell)
+        # is kept as given so only years_of_service() fails for this employee
+        if isinstance(join_date, str) and join_date:
+            try:
+                join_date = _as_date(join_date)
+            except ValueError:
+                pass
         # Core data dictionary that will contain all employee attributes
         self.data = {
             'emp_id': emp_id,
             'name': name,
-            'join_date': join_date,  # YYYY-MM-DD string or date object
+            'join_date': join_date,  # datetime.date (YYYY-MM-DD strings also accepted)
             'role': role
         }
+        # years_of_service() is cached per calendar day and join date
+        self._yos_cache = (None, None, None)  # (today_ordinal, join_ordinal, years)
 
     def calculate_salary(self):
         """Placeholder -- overridden by subclasses. Returns numeric salary amount."""
@@ -36,27 +95,37 @@ class Employee:
 
     def years_of_service(self):
         """Compute years of service (integer) from join_date to today."""
-        jd = self.data['join_date']
-        if isinstance(jd, str):
-            y, m, d = jd.split('-')
-            jd = date(int(y), int(m), int(d))
-        today = date.today()
-        return today.year - jd.year - ((today.month, today.day) < (jd.month, jd.day))
+        today_ordinal = date.today().toordinal()
+        join_ordinal = _as_date(self.data['join_date']).toordinal()
+        cached_today, cached_join, cached_years = self._yos_cache
+        if cached_today == today_ordinal and cached_join == join_ordinal:
+            return cached_years
+        years = _years_between(join_ordinal, today_ordinal)
+        self._yos_cache = (today_ordinal, join_ordinal, years)
+        return years
 
     def to_dict(self):
-        """Return the data dictionary for saving/inspection. Subclasses may add keys."""
-        return dict(self.data)
+        """Return the data dictionary for saving/inspection. Subclasses may add keys.
+
+        join_date is returned as a YYYY-MM-DD string so the result stays serializable.
+        """
+        d = dict(self.data)
+        if isinstance(d['join_date'], date):
+            d['join_date'] = d['join_date'].isoformat()
+        return d
 
 
 class FullTime(Employee):
     """Full-time employee with fixed monthly salary and annual bonus rules."""
 
+    __slots__ = ()
+
     def __init__(self, emp_id, name, join_date, monthly_salary, role='Full-Time'):
         super().__init__(emp_id, name, join_date, role)
         # Store type-specific data in the dictionary
         self.data.update({
             'monthly_salary': monthly_salary,
-            'bonus_percent': 0.05  # base 5% annual bonus
+            'bonus_percent': _FT_BASE_BONUS  # base 5% annual bonus
         })
 
     def calculate_salary(self, months=1, apply_bonus=False):
@@ -70,21 +139,16 @@ class FullTime(Employee):
         - For each full 3 years of service, add +1% to bonus, capped at +5% extra
         - Final bonus applies once when apply_bonus=True and is added to the total pay as a lump sum
         """
-        base = self.data['monthly_salary'] * months
-
-        if apply_bonus:
-            years = self.years_of_service()
-            extra = min((years // 3) * 0.01, 0.05)  # up to +5%
-            bonus_rate = self.data['bonus_percent'] + extra
-            bonus_amount = base * bonus_rate
-            return round(base + bonus_amount, 2)
-
-        return round(base, 2)
+        years = self.years_of_service() if apply_bonus else 0
+        return _ft_pay(self.data['monthly_salary'], months, years,
+                       self.data['bonus_percent'], apply_bonus)
 
 
 class PartTime(Employee):
     """Part-time employee paid hourly, may receive a small bonus based on hours worked."""
 
+    __slots__ = ()
+
     def __init__(self, emp_id, name, join_date, hourly_rate, role='Part-Time'):
         super().__init__(emp_id, name, join_date, role)
         self.data.update({
@@ -111,6 +175,8 @@ class PartTime(Employee):
 class Intern(Employee):
     """Intern with a fixed stipend and no bonus, but may get a completion allowance."""
 
+    __slots__ = ()
+
     def __init__(self, emp_id, name, join_date, stipend, role='Intern'):
         super().__init__(emp_id, name, join_date, role)
         self.data.update({
@@ -127,6 +193,37 @@ class Intern(Employee):
         return round(base + allowance, 2)
 
 
+# CSV row -> Employee constructors, keyed by the 'role' column
+def _make_full_time(row):
+    monthly_salary = float(row.get('monthly_salary', 0) or 0)
+    return FullTime(row.get('emp_id'), row.get('name'), row.get('join_date'), monthly_salary)
+
+
+def _make_part_time(row):
+    hourly = float(row.get('hourly_rate', 0) or 0)
+    emp = PartTime(row.get('emp_id'), row.get('name'), row.get('join_date'), hourly)
+    # if monthly_hours present, restore it
+    mh = row.get('monthly_hours')
+    if mh:
+        emp.data['monthly_hours'] = float(mh)
+    return emp
+
+
+def _make_intern(row):
+    stipend = float(row.get('stipend', 0) or 0)
+    emp = Intern(row.get('emp_id'), row.get('name'), row.get('join_date'), stipend)
+    if row.get('completed') in ('True', 'true', '1'):
+        emp.data['completed'] = True
+    return emp
+
+
+_ROLE_CTORS = {
+    'Full-Time': _make_full_time,
+    'Part-Time': _make_part_time,
+    'Intern': _make_intern,
+}
+
+
 class HRSystem:
     """Manages a registry of employees and supports persistence.
 
@@ -154,7 +251,82 @@ class HRSystem:
 
     def list_employees(self):
         """Return list of data dictionaries for all employees."""
-        return [emp.to_dict() for emp in self.employees.values()]
+        return list(self.iter_employees())
+
+    def iter_employees(self, fields=None):
+        """Yield to_dict() records lazily, one per employee.
+
+        - fields: optional iterable of keys; when given, each record is narrowed to
+          those keys (where present).
+        """
+        if fields is None:
+            for emp in self.employees.values():
+                yield emp.to_dict()
+        else:
+            fields = tuple(fields)
+            for emp in self.employees.values():
+                d = emp.to_dict()
+                yield {k: d[k] for k in fields if k in d}
+
+    def payroll_bulk(self, months=1, hours=None, apply_bonus=False):
+        """Compute pay for the whole registry in one pass. Returns {emp_id: amount}.
+
+        Employees using the stock calculate_salary() of their type are grouped into
+        parallel column lists and each group is computed in a single loop, instead of
+        one calculate_salary() call per employee. Results match the per-object methods:
+        - FullTime: calculate_salary(months, apply_bonus)
+        - PartTime: calculate_salary(hours, apply_bonus); hours=None uses each
+          employee's recorded monthly_hours. As with the method, the hours used are
+          recorded in data['monthly_hours'].
+        - Intern: calculate_salary(apply_completion_allowance=apply_bonus)
+        Subclasses of these types that override calculate_salary() are paid through their
+        own method with the same arguments. Other Employee subclasses that override
+        calculate_salary() are called with no arguments. Every emp_id is present in the
+        result; records with no salary rule (plain Employee) map to None.
+        """
+        ft_ids, ft_salary, ft_bonus, ft_years = [], [], [], []
+        pt_ids, pt_rate, pt_hours = [], [], []
+        in_ids, in_stipend, in_completed = [], [], []
+        pay = {}
+        for emp_id, emp in self.employees.items():
+            method = type(emp).calculate_salary
+            d = emp.data
+            if method is FullTime.calculate_salary:
+                ft_ids.append(emp_id)
+                ft_salary.append(d['monthly_salary'])
+                ft_bonus.append(d['bonus_percent'])
+                ft_years.append(emp.years_of_service() if apply_bonus else 0)
+            elif method is PartTime.calculate_salary:
+                if hours is not None:
+                    d['monthly_hours'] = hours
+                pt_ids.append(emp_id)
+                pt_rate.append(d['hourly_rate'])
+                pt_hours.append(d['monthly_hours'])
+            elif method is Intern.calculate_salary:
+                in_ids.append(emp_id)
+                in_stipend.append(d['stipend'])
+                in_completed.append(d.get('completed', False))
+            elif isinstance(emp, FullTime):
+                pay[emp_id] = emp.calculate_salary(months=months, apply_bonus=apply_bonus)
+            elif isinstance(emp, PartTime):
+                h = d['monthly_hours'] if hours is None else hours
+                pay[emp_id] = emp.calculate_salary(h, apply_bonus=apply_bonus)
+            elif isinstance(emp, Intern):
+                pay[emp_id] = emp.calculate_salary(apply_completion_allowance=apply_bonus)
+            elif method is not Employee.calculate_salary:
+                pay[emp_id] = emp.calculate_salary()
+            else:
+                pay[emp_id] = None
+
+        ft_pay = _ft_kernel(months, bool(apply_bonus))
+        for emp_id, ms, bp, years in zip(ft_ids, ft_salary, ft_bonus, ft_years):
+            pay[emp_id] = ft_pay(ms, years, bp)
+        for emp_id, hr, h in zip(pt_ids, pt_rate, pt_hours):
+            base = hr * h
+            pay[emp_id] = round(base + base * 0.02 if apply_bonus and h >= 80 else base, 2)
+        for emp_id, st, done in zip(in_ids, in_stipend, in_completed):
+            pay[emp_id] = round(st + 0.10 * st if apply_bonus and done else st, 2)
+        return pay
 
     def save_to_file(self):
         """Save the current registry to CSV using the dictionaries returned by to_dict().
@@ -165,18 +337,19 @@ class HRSystem:
             return
         # Collect all keys
         all_keys = set()
-        rows = []
-        for emp in self.employees.values():
-            d = emp.to_dict()
+        rows = [None] * len(self.employees)
+        for i, d in enumerate(self.iter_employees()):
             all_keys.update(d.keys())
-            rows.append(d)
-        all_keys = sorted(all_keys)
+            rows[i] = d
+        all_keys = tuple(sorted(all_keys))
 
-        with open(self.storage_file, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=all_keys)
-            writer.writeheader()
-            for r in rows:
-                writer.writerow(r)
+        # Plain csv.writer on positional rows avoids DictWriter's per-row field lookups;
+        # writerows() keeps the row loop inside the C writer
+        with open(self.storage_file, mode='w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(all_keys)
+            writer.writerows([r.get(k, '') for k in all_keys] for r in rows)
 
     def _load_from_file(self):
         """Attempt to load employees from CSV and create Employee objects.
@@ -192,26 +365,12 @@ class HRSystem:
                 for row in reader:
                     role = row.get('role', '')
                     emp_id = row.get('emp_id')
-                    name = row.get('name')
-                    join_date = row.get('join_date')
-                    if role == 'Full-Time':
-                        monthly_salary = float(row.get('monthly_salary', 0) or 0)
-                        emp = FullTime(emp_id, name, join_date, monthly_salary)
-                    elif role == 'Part-Time':
-                        hourly = float(row.get('hourly_rate', 0) or 0)
-                        emp = PartTime(emp_id, name, join_date, hourly)
-                        # if monthly_hours present, restore it
-                        mh = row.get('monthly_hours')
-                        if mh:
-                            emp.data['monthly_hours'] = float(mh)
-                    elif role == 'Intern':
-                        stipend = float(row.get('stipend', 0) or 0)
-                        emp = Intern(emp_id, name, join_date, stipend)
-                        if row.get('completed') in ('True', 'true', '1'):
-                            emp.data['completed'] = True
+                    ctor = _ROLE_CTORS.get(role)
+                    if ctor is not None:
+                        emp = ctor(row)
                     else:
                         # unknown role -> generic Employee record
-                        emp = Employee(emp_id, name, join_date, role=role)
+                        emp = Employee(emp_id, row.get('name'), row.get('join_date'), role=role)
                     # Update any extra fields from CSV into data dict
                     for k, v in row.items():
                         if k in ('emp_id', 'name', 'join_date', 'role'):
@@ -234,6 +393,32 @@ class HRSystem:
             self.employees = {}
 
 
+# Demo printers keyed by concrete employee type (one dict lookup per row)
+def _print_full_time(emp):
+    print('Monthly pay (no bonus):', emp.calculate_salary())
+    print('Yearly lump (3 months + bonus):', emp.calculate_salary(months=3, apply_bonus=True))
+
+
+def _print_part_time(emp):
+    print('Pay for 90 hours (with possible bonus):', emp.calculate_salary(hours_worked=90, apply_bonus=True))
+
+
+def _print_intern(emp):
+    print('Stipend:', emp.calculate_salary())
+    print('Stipend with completion allowance:', emp.calculate_salary(apply_completion_allowance=True))
+
+
+def _print_generic(emp):
+    print('Generic employee — no salary calculation available')
+
+
+_DEMO_PRINTERS = {
+    FullTime: _print_full_time,
+    PartTime: _print_part_time,
+    Intern: _print_intern,
+}
+
+
 # Example usage (this runs when file is executed directly)
 if __name__ == '__main__':
     hr = HRSystem()
@@ -256,15 +441,6 @@ if __name__ == '__main__':
         role = emp.data.get('role')
         print('-' * 40)
         print(f"ID: {emp.data.get('emp_id')} | Name: {emp.data.get('name')} | Role: {role}")
-        if isinstance(emp, FullTime):
-            print('Monthly pay (no bonus):', emp.calculate_salary())
-            print('Yearly lump (3 months + bonus):', emp.calculate_salary(months=3, apply_bonus=True))
-        elif isinstance(emp, PartTime):
-            print('Pay for 90 hours (with possible bonus):', emp.calculate_salary(hours_worked=90, apply_bonus=True))
-        elif isinstance(emp, Intern):
-            print('Stipend:', emp.calculate_salary())
-            print('Stipend with completion allowance:', emp.calculate_salary(apply_completion_allowance=True))
-        else:
-            print('Generic employee — no salary calculation available')
+        _DEMO_PRINTERS.get(type(emp), _print_generic)(emp)
 
     print('\nSaved employee records to', hr.storage_file)